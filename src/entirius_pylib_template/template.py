@@ -6,7 +6,8 @@ in the Entirius ecosystem.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 from dataclasses import dataclass
 
 
@@ -15,9 +16,9 @@ class TemplateError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateConfig:
-    """Configuration class for template operations."""
+    """Immutable configuration class for template operations."""
     max_length: int = 100
     min_length: int = 1
     allowed_chars: str = r"[a-zA-Z0-9_-]"
@@ -27,6 +28,127 @@ class TemplateConfig:
         """Validate configuration after initialization."""
         if self.max_length < self.min_length:
             raise TemplateError("max_length must be greater than or equal to min_length")
+        
+        # Build the cached matcher now so a bad pattern fails at construction
+        try:
+            _char_matcher(self.allowed_chars)
+        except re.error as exc:
+            raise TemplateError("Invalid allowed_chars pattern") from exc
+    
+    def compile_validator(self) -> Callable[[str], bool]:
+        """
+        Build a validator specialized for this configuration.
+        
+        The returned function behaves like ``validate_input(value, self)``
+        but has the configuration values bound in advance, which makes it
+        the fastest way to check many values against one configuration.
+        
+        Returns:
+            A function taking a string and returning True if it is valid.
+            
+        Example:
+            >>> is_slug = TemplateConfig(min_length=3).compile_validator()
+            >>> is_slug("my-slug")
+            True
+            >>> is_slug("no")
+            False
+        """
+        matches = _char_matcher(self.allowed_chars)
+        min_length = self.min_length
+        max_length = self.max_length
+        
+        if self.strip_whitespace:
+            def validator(value: str) -> bool:
+                if not isinstance(value, str):
+                    raise TemplateError("Value must be a string")
+                value = value.strip()
+                return min_length <= len(value) <= max_length and matches(value)
+        else:
+            def validator(value: str) -> bool:
+                if not isinstance(value, str):
+                    raise TemplateError("Value must be a string")
+                return min_length <= len(value) <= max_length and matches(value)
+        
+        return validator
+
+
+@lru_cache(maxsize=128)
+def _compiled_validator(allowed_chars: str) -> re.Pattern[str]:
+    """Compile and cache the validation pattern for a character class."""
+    # fullmatch anchors both ends; the group keeps the repeat applied to the
+    # whole pattern, and the possessive ++ never backtracks into it
+    return re.compile(f"(?:{allowed_chars})++")
+
+
+# Matches a bracketed character class without escapes, negation or nesting
+_SIMPLE_CLASS_RE = re.compile(r"\[([^\\\[\]^]+)\]")
+
+
+@lru_cache(maxsize=128)
+def _simple_class_bytes(allowed_chars: str) -> Optional[bytes]:
+    """
+    Resolve a simple ASCII character class to the set of bytes it allows.
+    
+    Returns None when the class is not simple enough to be checked without
+    the regex engine.
+    """
+    match = _SIMPLE_CLASS_RE.fullmatch(allowed_chars)
+    if match is None or not allowed_chars.isascii():
+        return None
+    
+    body = match.group(1)
+    allowed: Set[int] = set()
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == "-":
+            low, high = ord(body[i]), ord(body[i + 2])
+            if low > high:
+                return None
+            allowed.update(range(low, high + 1))
+            i += 3
+        else:
+            allowed.add(ord(body[i]))
+            i += 1
+    
+    return bytes(sorted(allowed))
+
+
+@lru_cache(maxsize=128)
+def _char_matcher(allowed_chars: str) -> Callable[[str], bool]:
+    """
+    Build a predicate checking that a non-empty string uses only allowed chars.
+    
+    Simple ASCII classes are checked with bytes.translate; anything else
+    falls back to the compiled regex.
+    """
+    allowed_bytes = _simple_class_bytes(allowed_chars)
+    if allowed_bytes is None:
+        fullmatch = _compiled_validator(allowed_chars).fullmatch
+        
+        def matches(value: str) -> bool:
+            return fullmatch(value) is not None
+        
+        return matches
+    
+    allowed_first = frozenset(allowed_bytes.decode("ascii"))
+    
+    def matches_bytes(value: str) -> bool:
+        # value[:1] is "" for empty input, which is never in the allowed set
+        return (
+            value[:1] in allowed_first
+            and value.isascii()
+            and not value.encode("ascii").translate(None, allowed_bytes)
+        )
+    
+    return matches_bytes
+
+
+# Shared configuration used when callers do not pass one; building it at
+# import also warms the pattern caches for the default character class
+_DEFAULT_CONFIG = TemplateConfig()
+
+
+_DEFAULT_GREETING = "Hello, World! Welcome to Entirius."
 
 
 def hello_entirius(name: Optional[str] = None) -> str:
@@ -46,7 +168,7 @@ def hello_entirius(name: Optional[str] = None) -> str:
         'Hello, Developer! Welcome to Entirius.'
     """
     if name is None:
-        name = "World"
+        return _DEFAULT_GREETING
     
     if not isinstance(name, str):
         raise TemplateError("Name must be a string")
@@ -83,21 +205,107 @@ def validate_input(
         raise TemplateError("Value must be a string")
     
     if config is None:
-        config = TemplateConfig()
+        config = _DEFAULT_CONFIG
     
     # Strip whitespace if configured
     if config.strip_whitespace:
         value = value.strip()
     
     # Check length constraints
-    if len(value) < config.min_length or len(value) > config.max_length:
+    if not config.min_length <= len(value) <= config.max_length:
         return False
     
     # Check allowed characters
-    if not re.match(f"^{config.allowed_chars}+$", value):
-        return False
+    return _char_matcher(config.allowed_chars)(value)
+
+
+def _process_str(data: str, config: TemplateConfig, result: Dict[str, Any]) -> None:
+    """Fill ``result`` for a single string input."""
+    result["processed_data"] = data.strip() if config.strip_whitespace else data
+    result["valid"] = validate_input(data, config)
+    result["length"] = len(result["processed_data"])
+
+
+def _validate_batch(values: List[str], config: TemplateConfig) -> List[bool]:
+    """
+    Validate already-stripped strings against a configuration in one pass.
     
-    return True
+    Config lookups are resolved once per batch rather than once per value.
+    """
+    matches = _char_matcher(config.allowed_chars)
+    min_length = config.min_length
+    max_length = config.max_length
+    
+    # A simple class matches per character, so one scan over the joined
+    # values settles the character check for every item; only emptiness
+    # is left to decide per item
+    is_simple_class = _simple_class_bytes(config.allowed_chars) is not None
+    if is_simple_class and matches("".join(values)):
+        matches = bool
+    
+    return [
+        min_length <= len(value) <= max_length and matches(value) for value in values
+    ]
+
+
+def _process_list(
+    data: List[str], config: TemplateConfig, result: Dict[str, Any]
+) -> None:
+    """Fill ``result`` for a list of strings."""
+    for item in data:
+        if not isinstance(item, str):
+            raise TemplateError(f"List items must be strings, got {type(item)}")
+    
+    values = [item.strip() for item in data] if config.strip_whitespace else data
+    validity = _validate_batch(values, config)
+    
+    processed_items = [
+        {"value": value, "valid": is_valid, "length": len(value)}
+        for value, is_valid in zip(values, validity, strict=True)
+    ]
+    valid_items = sum(validity)
+    total_items = len(data)
+    
+    result["processed_data"] = processed_items
+    result["total_items"] = total_items
+    result["valid_items"] = valid_items
+    result["valid"] = valid_items == total_items
+
+
+def _process_dict(
+    data: Dict[str, Any], config: TemplateConfig, result: Dict[str, Any]
+) -> None:
+    """Fill ``result`` for a dictionary with string keys."""
+    for key in data:
+        if not isinstance(key, str):
+            raise TemplateError("Dictionary keys must be strings")
+    
+    keys = [key.strip() for key in data] if config.strip_whitespace else list(data)
+    validity = _validate_batch(keys, config)
+    
+    processed_dict = {
+        key: {
+            "original_value": value,
+            "key_valid": key_valid,
+            "value_type": type(value).__name__
+        }
+        for key, key_valid, value in zip(keys, validity, data.values(), strict=True)
+    }
+    valid_keys = sum(validity)
+    total_keys = len(data)
+    
+    result["processed_data"] = processed_dict
+    result["total_keys"] = total_keys
+    result["valid_keys"] = valid_keys
+    result["valid"] = valid_keys == total_keys
+
+
+# process_data handlers keyed on the exact input type
+_HANDLERS: Dict[type, Callable[[Any, TemplateConfig, Dict[str, Any]], None]] = {
+    str: _process_str,
+    list: _process_list,
+    dict: _process_dict,
+}
 
 
 def process_data(
@@ -128,7 +336,7 @@ def process_data(
         True
     """
     if config is None:
-        config = TemplateConfig()
+        config = _DEFAULT_CONFIG
     
     result = {
         "input_type": type(data).__name__,
@@ -139,60 +347,16 @@ def process_data(
         }
     }
     
-    if isinstance(data, str):
-        result["processed_data"] = data.strip() if config.strip_whitespace else data
-        result["valid"] = validate_input(data, config)
-        result["length"] = len(result["processed_data"])
-        
-    elif isinstance(data, list):
-        processed_items = []
-        valid_items = 0
-        
-        for item in data:
-            if isinstance(item, str):
-                processed_item = item.strip() if config.strip_whitespace else item
-                is_valid = validate_input(item, config)
-                processed_items.append({
-                    "value": processed_item,
-                    "valid": is_valid,
-                    "length": len(processed_item)
-                })
-                if is_valid:
-                    valid_items += 1
-            else:
-                raise TemplateError(f"List items must be strings, got {type(item)}")
-        
-        result["processed_data"] = processed_items
-        result["total_items"] = len(data)
-        result["valid_items"] = valid_items
-        result["valid"] = valid_items == len(data)
-        
-    elif isinstance(data, dict):
-        processed_dict = {}
-        valid_keys = 0
-        
-        for key, value in data.items():
-            if not isinstance(key, str):
-                raise TemplateError("Dictionary keys must be strings")
-            
-            key_valid = validate_input(key, config)
-            processed_key = key.strip() if config.strip_whitespace else key
-            
-            processed_dict[processed_key] = {
-                "original_value": value,
-                "key_valid": key_valid,
-                "value_type": type(value).__name__
-            }
-            
-            if key_valid:
-                valid_keys += 1
-        
-        result["processed_data"] = processed_dict
-        result["total_keys"] = len(data)
-        result["valid_keys"] = valid_keys
-        result["valid"] = valid_keys == len(data)
-        
-    else:
-        raise TemplateError(f"Unsupported data type: {type(data)}")
+    handler = _HANDLERS.get(type(data))
+    if handler is None:
+        # Fall back to isinstance so subclasses of supported types still work
+        for base, base_handler in _HANDLERS.items():
+            if isinstance(data, base):
+                handler = base_handler
+                break
+        else:
+            raise TemplateError(f"Unsupported data type: {type(data)}")
+    
+    handler(data, config, result)
     
-    return result
\ No newline at end of file
+    return result
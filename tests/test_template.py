@@ -5,6 +5,10 @@ This test suite demonstrates best practices for testing Python libraries
 in the Entirius ecosystem.
 """
 
+import dataclasses
+import json
+import pickle
+
 import pytest
 from entirius_pylib_template import (
     hello_entirius,
@@ -67,6 +71,46 @@ class TestTemplateConfig:
         """Test that max_length < min_length raises TemplateError."""
         with pytest.raises(TemplateError, match="max_length must be greater than or equal to min_length"):
             TemplateConfig(max_length=5, min_length=10)
+    
+    def test_invalid_allowed_chars_pattern(self):
+        """Test that an invalid allowed_chars pattern raises TemplateError."""
+        with pytest.raises(TemplateError, match="Invalid allowed_chars pattern"):
+            TemplateConfig(allowed_chars="[")
+    
+    def test_config_is_immutable(self):
+        """Test that configuration fields cannot be changed after creation."""
+        config = TemplateConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_length = 10
+    
+    def test_config_is_hashable(self):
+        """Test that equal configurations hash equally."""
+        first = TemplateConfig(max_length=10)
+        second = TemplateConfig(max_length=10)
+        assert hash(first) == hash(second)
+        configs = {TemplateConfig(), TemplateConfig(), TemplateConfig(min_length=2)}
+        assert len(configs) == 2
+    
+    def test_config_pickle_round_trip(self):
+        """Test that configurations survive pickling unchanged."""
+        config = TemplateConfig(max_length=20, allowed_chars=r"[a-z]")
+        restored = pickle.loads(pickle.dumps(config))  # noqa: S301
+        
+        assert restored == config
+        assert validate_input("abc", restored) is True
+        assert validate_input("ABC", restored) is False
+    
+    def test_config_asdict_contains_only_public_fields(self):
+        """Test that asdict exposes just the configuration values."""
+        config = TemplateConfig(max_length=20)
+        
+        assert dataclasses.asdict(config) == {
+            "max_length": 20,
+            "min_length": 1,
+            "allowed_chars": r"[a-zA-Z0-9_-]",
+            "strip_whitespace": True,
+        }
+        assert json.loads(json.dumps(dataclasses.asdict(config)))["max_length"] == 20
 
 
 class TestValidateInput:
@@ -106,12 +150,74 @@ class TestValidateInput:
         config = TemplateConfig(strip_whitespace=False)
         assert validate_input("  test  ", config) is False  # Space not in allowed chars
     
+    def test_trailing_newline_rejected_without_stripping(self):
+        """Test that a trailing newline is not accepted by the character check."""
+        config = TemplateConfig(strip_whitespace=False)
+        assert validate_input("test\n", config) is False
+    
+    def test_empty_string_with_zero_min_length(self):
+        """Test that an empty string never satisfies the character check."""
+        assert validate_input("", TemplateConfig(min_length=0)) is False
+        config = TemplateConfig(min_length=0, allowed_chars=r"[\w]")
+        assert validate_input("", config) is False
+    
+    def test_non_ascii_input_rejected(self):
+        """Test that non-ASCII characters fail the default character class."""
+        assert validate_input("zażółć") is False
+        assert validate_input("test\u00a0value") is False
+    
+    def test_complex_allowed_chars(self):
+        """Test validation with a character class that needs the regex engine."""
+        config = TemplateConfig(allowed_chars=r"[\w.]")
+        assert validate_input("file.name_1", config) is True
+        assert validate_input("file/name", config) is False
+    
+    def test_alternation_in_allowed_chars(self):
+        """Test that an alternation is repeated as a whole."""
+        config = TemplateConfig(allowed_chars=r"ab|cd")
+        assert validate_input("abcdab", config) is True
+        assert validate_input("abc", config) is False
+    
+    @pytest.mark.parametrize("allowed_chars", [r"[a-z]+", r"\w+", r"[a-z]*"])
+    def test_nested_quantifier_does_not_backtrack(self, allowed_chars):
+        """Test that quantified allowed_chars reject long invalid values quickly."""
+        config = TemplateConfig(allowed_chars=allowed_chars)
+        assert validate_input("a" * 99 + "!", config) is False
+        assert validate_input("a" * 100, config) is True
+    
     def test_non_string_input(self):
         """Test that non-string input raises TemplateError."""
         with pytest.raises(TemplateError, match="Value must be a string"):
             validate_input(123)
 
 
+class TestCompileValidator:
+    """Test cases for TemplateConfig.compile_validator."""
+    
+    @pytest.mark.parametrize("strip_whitespace", [True, False])
+    def test_matches_validate_input(self, strip_whitespace):
+        """Test that the compiled validator agrees with validate_input."""
+        config = TemplateConfig(
+            min_length=2, max_length=6, strip_whitespace=strip_whitespace
+        )
+        validator = config.compile_validator()
+        
+        for value in ["ok", "x", "toolong_", " pad ", "bad@", "", "zażółć"]:
+            assert validator(value) is validate_input(value, config)
+    
+    def test_complex_allowed_chars(self):
+        """Test a compiled validator for a pattern needing the regex engine."""
+        validator = TemplateConfig(allowed_chars=r"[\w.]").compile_validator()
+        assert validator("file.name") is True
+        assert validator("file/name") is False
+    
+    def test_non_string_input(self):
+        """Test that the compiled validator rejects non-string input."""
+        validator = TemplateConfig().compile_validator()
+        with pytest.raises(TemplateError, match="Value must be a string"):
+            validator(123)
+
+
 class TestProcessData:
     """Test cases for process_data function."""
     
@@ -148,6 +254,42 @@ class TestProcessData:
         assert result["processed_data"][1]["valid"] is True
         assert result["processed_data"][2]["valid"] is False
     
+    def test_process_list_without_stripping(self):
+        """Test that list items are kept verbatim when stripping is disabled."""
+        config = TemplateConfig(strip_whitespace=False)
+        result = process_data([" padded ", "clean"], config)
+        
+        assert result["processed_data"][0] == {
+            "value": " padded ",
+            "valid": False,
+            "length": 8,
+        }
+        assert result["processed_data"][1] == {
+            "value": "clean",
+            "valid": True,
+            "length": 5,
+        }
+        assert result["valid_items"] == 1
+    
+    def test_process_list_all_allowed_chars(self):
+        """Test list processing when every item uses only allowed characters."""
+        config = TemplateConfig(min_length=0, max_length=5)
+        result = process_data(["abc", "", "abcdef", "a-b_c"], config)
+        
+        assert [item["valid"] for item in result["processed_data"]] == [
+            True, False, False, True
+        ]
+        assert result["valid_items"] == 2
+    
+    def test_process_result_is_plain_data(self):
+        """Test that results are plain dicts and lists callers can serialize."""
+        result = process_data(["test1", "test2"])
+        
+        assert type(result) is dict
+        assert type(result["processed_data"]) is list
+        assert all(type(item) is dict for item in result["processed_data"])
+        assert json.loads(json.dumps(result)) == result
+    
     def test_process_dict_data(self):
         """Test processing dictionary data."""
         data = {"valid_key": "value1", "invalid@key": "value2"}
@@ -164,6 +306,14 @@ class TestProcessData:
         assert result["processed_data"]["valid_key"]["key_valid"] is True
         assert result["processed_data"]["invalid@key"]["key_valid"] is False
     
+    def test_process_dict_strips_keys(self):
+        """Test that dict keys are stripped before validation when configured."""
+        result = process_data({"  padded_key  ": 1, "bad key": 2})
+        
+        assert result["processed_data"]["padded_key"]["key_valid"] is True
+        assert result["processed_data"]["bad key"]["key_valid"] is False
+        assert result["valid_keys"] == 1
+    
     def test_process_list_with_non_string_item(self):
         """Test that list with non-string items raises TemplateError."""
         data = ["valid", 123, "also_valid"]
@@ -176,6 +326,17 @@ class TestProcessData:
         with pytest.raises(TemplateError, match="Dictionary keys must be strings"):
             process_data(data)
     
+    def test_process_subclass_of_supported_type(self):
+        """Test that subclasses of supported types are processed like their base."""
+        class Tags(list):
+            pass
+        
+        result = process_data(Tags(["test1", "invalid@value"]))
+        
+        assert result["input_type"] == "Tags"
+        assert result["total_items"] == 2
+        assert result["valid_items"] == 1
+    
     def test_process_unsupported_data_type(self):
         """Test that unsupported data types raise TemplateError."""
         with pytest.raises(TemplateError, match="Unsupported data type"):
@@ -189,6 +350,15 @@ class TestProcessData:
         assert result["valid"] is False
         assert result["config_used"]["max_length"] == 5
         assert result["config_used"]["min_length"] == 2
+    
+    def test_config_used_is_independent_per_result(self):
+        """Test that modifying one result's config_used does not leak into others."""
+        config = TemplateConfig(max_length=5)
+        first = process_data("abc", config)
+        first["config_used"]["max_length"] = 99
+        
+        second = process_data("abc", config)
+        assert second["config_used"] == {"max_length": 5, "min_length": 1}
 
 
 class TestIntegration: